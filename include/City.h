@@ -1,5 +1,6 @@
 #pragma once
 
+#include <cstddef>
 #include <vector>
 #include <string>
 #include <array>
@@ -94,6 +95,29 @@ inline double roadWidth(RoadType type) {
     }
 }
 
+/**
+ * @brief Aggregate statistics describing a generated city.
+ *
+ * Produced by City::computeSummary() and serialised by City::saveSummary();
+ * also returned in place through the C API (see src/c_api.cpp) so callers
+ * can consume the numbers without parsing JSON.
+ */
+struct CitySummaryData {
+    std::size_t totalBuildings = 0;
+    std::size_t residentialCells = 0;
+    std::size_t commercialCells = 0;
+    std::size_t industrialCells = 0;
+    std::size_t greenCells = 0;
+    std::size_t undevelopedCells = 0;
+    std::size_t numHospitals = 0;
+    std::size_t numSchools = 0;
+    double maxDistanceToSchool = -1.0;
+    double maxDistanceToHospital = -1.0;
+    int maxResidentialHeight = 0;
+    int maxCommercialHeight = 0;
+    int maxIndustrialHeight = 0;
+};
+
 /**
  * @brief Representation of an entire city.
  *
@@ -168,6 +192,13 @@ public:
      */
     void saveGLTF(const std::string &filename, bool binary = false) const;
 
+    /**
+     * @brief Compute the high‑level statistics of the city.
+     *
+     * Shared by saveSummary() and the C API so both emit identical numbers.
+     */
+    CitySummaryData computeSummary() const;
+
     /**
      * @brief Write a JSON file summarising high‑level statistics of the city.
      *
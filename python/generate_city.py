@@ -25,6 +25,7 @@ called from Python code.
 """
 
 import argparse
+import ctypes
 import json
 import subprocess
 import sys
@@ -85,6 +86,30 @@ class CitySummary:
             max_industrial_height=int(data["maxIndustrialHeight"]),
         )
 
+    def to_mapping(self) -> dict:
+        """Return the summary as the camelCase mapping emitted by ``citygen``.
+
+        Inverse of :meth:`from_mapping`; handy for JSON serialisation and
+        for callers that still expect the historical dict shape.
+        """
+
+        return {
+            "gridSize": self.grid_size,
+            "totalBuildings": self.total_buildings,
+            "residentialCells": self.residential_cells,
+            "commercialCells": self.commercial_cells,
+            "industrialCells": self.industrial_cells,
+            "greenCells": self.green_cells,
+            "undevelopedCells": self.undeveloped_cells,
+            "numHospitals": self.num_hospitals,
+            "numSchools": self.num_schools,
+            "maxDistanceToSchool": self.max_distance_to_school,
+            "maxDistanceToHospital": self.max_distance_to_hospital,
+            "maxResidentialHeight": self.max_residential_height,
+            "maxCommercialHeight": self.max_commercial_height,
+            "maxIndustrialHeight": self.max_industrial_height,
+        }
+
 
 @dataclass
 class CityArtifacts:
@@ -97,6 +122,92 @@ class CityArtifacts:
     summary: CitySummary
 
 
+class _CConfig(ctypes.Structure):
+    """Mirror of ``CitygenCConfig`` in ``src/c_api.cpp``."""
+
+    _fields_ = [
+        ("seed", ctypes.c_uint32),
+        ("population", ctypes.c_int32),
+        ("grid_size", ctypes.c_int32),
+        ("radius_fraction", ctypes.c_double),
+        ("hospitals", ctypes.c_int32),
+        ("schools", ctypes.c_int32),
+        ("transport", ctypes.c_int32),
+        ("output_dir", ctypes.c_char_p),
+    ]
+
+
+class _CSummary(ctypes.Structure):
+    """Mirror of ``CitygenCSummary`` in ``src/c_api.cpp``."""
+
+    _fields_ = [
+        ("grid_size", ctypes.c_int32),
+        ("total_buildings", ctypes.c_uint64),
+        ("residential_cells", ctypes.c_uint64),
+        ("commercial_cells", ctypes.c_uint64),
+        ("industrial_cells", ctypes.c_uint64),
+        ("green_cells", ctypes.c_uint64),
+        ("undeveloped_cells", ctypes.c_uint64),
+        ("num_hospitals", ctypes.c_uint64),
+        ("num_schools", ctypes.c_uint64),
+        ("max_distance_to_school", ctypes.c_double),
+        ("max_distance_to_hospital", ctypes.c_double),
+        ("max_residential_height", ctypes.c_int32),
+        ("max_commercial_height", ctypes.c_int32),
+        ("max_industrial_height", ctypes.c_int32),
+    ]
+
+
+_TRANSPORT_CODES = {
+    "car": 0,
+    "transit": 1,
+    "public": 1,
+    "public_transit": 1,
+    "walk": 2,
+    "pedestrian": 2,
+}
+
+
+def _load_citygen_library():
+    """Load ``libcitygen.so`` and bind ``citygen_generate`` if present.
+
+    The library is built by the CMake target ``citygen_shared``.  Returns
+    the bound function or ``None`` when only the CLI binary is available —
+    :func:`generate` then falls back to ``subprocess``.
+    """
+    root = Path(__file__).resolve().parent.parent
+    for candidate in (root / "libcitygen.so", root / "build" / "libcitygen.so"):
+        if candidate.exists():
+            lib = ctypes.CDLL(str(candidate))
+            fn = lib.citygen_generate
+            fn.argtypes = [ctypes.POINTER(_CConfig), ctypes.POINTER(_CSummary)]
+            fn.restype = ctypes.c_int
+            return fn
+    return None
+
+
+_citygen_generate = _load_citygen_library()
+
+
+def _summary_from_struct(raw: _CSummary) -> CitySummary:
+    return CitySummary(
+        grid_size=int(raw.grid_size),
+        total_buildings=int(raw.total_buildings),
+        residential_cells=int(raw.residential_cells),
+        commercial_cells=int(raw.commercial_cells),
+        industrial_cells=int(raw.industrial_cells),
+        green_cells=int(raw.green_cells),
+        undeveloped_cells=int(raw.undeveloped_cells),
+        num_hospitals=int(raw.num_hospitals),
+        num_schools=int(raw.num_schools),
+        max_distance_to_school=float(raw.max_distance_to_school),
+        max_distance_to_hospital=float(raw.max_distance_to_hospital),
+        max_residential_height=int(raw.max_residential_height),
+        max_commercial_height=int(raw.max_commercial_height),
+        max_industrial_height=int(raw.max_industrial_height),
+    )
+
+
 def _load_summary(summary_path: Path) -> CitySummary:
     with open(summary_path, "r", encoding="utf-8") as f:
         data = json.load(f)
@@ -104,7 +215,13 @@ def _load_summary(summary_path: Path) -> CitySummary:
 
 
 def generate(config: CityConfig, *, as_objects: bool = False) -> Optional[CityArtifacts]:
-    """Generate a city using the compiled ``citygen`` executable.
+    """Generate a city using the compiled generator.
+
+    When the shared library (``libcitygen.so``) has been built, the
+    pipeline runs in-process through ``citygen_generate`` — no fork/exec
+    and no JSON parse; the summary comes back in a C struct.  Otherwise
+    the ``citygen`` executable is invoked as before.  Both paths write
+    ``city.obj`` and ``city_summary.json`` to the output directory.
 
     Parameters
     ----------
@@ -126,10 +243,40 @@ def generate(config: CityConfig, *, as_objects: bool = False) -> Optional[CityAr
     Raises
     ------
     RuntimeError
-        If the city generator executable returns a non-zero exit code.
+        If the city generator returns a non-zero exit code.
     FileNotFoundError
-        If the compiled ``citygen`` binary cannot be located.
+        If neither the shared library nor the ``citygen`` binary can be
+        located.
     """
+    output_dir = Path(config.output)
+    model_path = output_dir / "city.obj"
+    summary_path = output_dir / "city_summary.json"
+
+    if _citygen_generate is not None:
+        c_cfg = _CConfig(
+            seed=config.seed,
+            population=config.population,
+            grid_size=config.grid_size,
+            radius_fraction=config.radius_fraction,
+            hospitals=config.hospitals,
+            schools=config.schools,
+            transport=_TRANSPORT_CODES.get(config.transport.lower(), 0),
+            output_dir=str(config.output).encode(),
+        )
+        raw = _CSummary()
+        rc = _citygen_generate(ctypes.byref(c_cfg), ctypes.byref(raw))
+        if rc != 0:
+            raise RuntimeError(f"citygen_generate failed with code {rc}")
+        if as_objects:
+            return CityArtifacts(
+                config=config,
+                output_dir=output_dir,
+                model_path=model_path,
+                summary_path=summary_path,
+                summary=_summary_from_struct(raw),
+            )
+        return None
+
     exe = Path(__file__).resolve().parent.parent / "citygen"
     if not exe.exists():
         raise FileNotFoundError(f"Executable not found: {exe}")
@@ -694,25 +694,14 @@ void City::saveGLTF(const std::string &filename, bool binary) const {
     }
 }
 
-void City::saveSummary(const std::string &filename) const {
-    std::ofstream ofs(filename);
-    if (!ofs) return;
-    // Count metrics
-    std::size_t countResidential = 0;
-    std::size_t countCommercial = 0;
-    std::size_t countIndustrial = 0;
-    std::size_t countGreen = 0;
-    std::size_t countUndeveloped = 0;
-    std::size_t totalBuildings = 0;
-    int maxResidentialHeight = 0;
-    int maxCommercialHeight = 0;
-    int maxIndustrialHeight = 0;
+CitySummaryData City::computeSummary() const {
+    CitySummaryData s;
     for (const auto z : zones) {
-        if (z == ZoneType::None) { countUndeveloped++; continue; }
-        if (z == ZoneType::Residential) countResidential++;
-        else if (z == ZoneType::Commercial) countCommercial++;
-        else if (z == ZoneType::Industrial) countIndustrial++;
-        else if (z == ZoneType::Green) countGreen++;
+        if (z == ZoneType::None) { s.undevelopedCells++; continue; }
+        if (z == ZoneType::Residential) s.residentialCells++;
+        else if (z == ZoneType::Commercial) s.commercialCells++;
+        else if (z == ZoneType::Industrial) s.industrialCells++;
+        else if (z == ZoneType::Green) s.greenCells++;
     }
     std::vector<std::pair<double, double>> schoolPos;
     std::vector<std::pair<double, double>> hospitalPos;
@@ -733,50 +722,53 @@ void City::saveSummary(const std::string &filename) const {
         }
         return best;
     };
-    double maxDistSchool = -1.0;
-    double maxDistHospital = -1.0;
     for (const auto &b : buildings) {
         if (b.zone != ZoneType::None && b.zone != ZoneType::Green) {
-            totalBuildings++;
+            s.totalBuildings++;
         }
         if (b.zone == ZoneType::Residential) {
-            maxResidentialHeight = std::max(maxResidentialHeight, b.height);
+            s.maxResidentialHeight = std::max(s.maxResidentialHeight, b.height);
             if (!schoolPos.empty()) {
                 double d = nearest(b.footprint.centreX(), b.footprint.centreY(), schoolPos);
-                if (d > maxDistSchool) maxDistSchool = d;
+                if (d > s.maxDistanceToSchool) s.maxDistanceToSchool = d;
             }
             if (!hospitalPos.empty()) {
                 double d = nearest(b.footprint.centreX(), b.footprint.centreY(), hospitalPos);
-                if (d > maxDistHospital) maxDistHospital = d;
+                if (d > s.maxDistanceToHospital) s.maxDistanceToHospital = d;
             }
         } else if (b.zone == ZoneType::Commercial) {
-            maxCommercialHeight = std::max(maxCommercialHeight, b.height);
+            s.maxCommercialHeight = std::max(s.maxCommercialHeight, b.height);
         } else if (b.zone == ZoneType::Industrial) {
-            maxIndustrialHeight = std::max(maxIndustrialHeight, b.height);
+            s.maxIndustrialHeight = std::max(s.maxIndustrialHeight, b.height);
         }
     }
-    std::size_t countHospitals = 0;
-    std::size_t countSchools = 0;
     for (const auto &f : facilities) {
-        if (f.type == Facility::Type::Hospital) countHospitals++;
-        else if (f.type == Facility::Type::School) countSchools++;
+        if (f.type == Facility::Type::Hospital) s.numHospitals++;
+        else if (f.type == Facility::Type::School) s.numSchools++;
     }
+    return s;
+}
+
+void City::saveSummary(const std::string &filename) const {
+    std::ofstream ofs(filename);
+    if (!ofs) return;
+    const CitySummaryData s = computeSummary();
     // Write JSON.  Note: this is simplistic and not pretty‑printed.
     ofs << "{\n";
     ofs << "  \"gridSize\": " << size << ",\n";
-    ofs << "  \"totalBuildings\": " << totalBuildings << ",\n";
-    ofs << "  \"residentialCells\": " << countResidential << ",\n";
-    ofs << "  \"commercialCells\": " << countCommercial << ",\n";
-    ofs << "  \"industrialCells\": " << countIndustrial << ",\n";
-    ofs << "  \"greenCells\": " << countGreen << ",\n";
-    ofs << "  \"undevelopedCells\": " << countUndeveloped << ",\n";
-    ofs << "  \"numHospitals\": " << countHospitals << ",\n";
-    ofs << "  \"numSchools\": " << countSchools << ",\n";
-    ofs << "  \"maxDistanceToSchool\": " << maxDistSchool << ",\n";
-    ofs << "  \"maxDistanceToHospital\": " << maxDistHospital << ",\n";
-    ofs << "  \"maxResidentialHeight\": " << maxResidentialHeight << ",\n";
-    ofs << "  \"maxCommercialHeight\": " << maxCommercialHeight << ",\n";
-    ofs << "  \"maxIndustrialHeight\": " << maxIndustrialHeight << "\n";
+    ofs << "  \"totalBuildings\": " << s.totalBuildings << ",\n";
+    ofs << "  \"residentialCells\": " << s.residentialCells << ",\n";
+    ofs << "  \"commercialCells\": " << s.commercialCells << ",\n";
+    ofs << "  \"industrialCells\": " << s.industrialCells << ",\n";
+    ofs << "  \"greenCells\": " << s.greenCells << ",\n";
+    ofs << "  \"undevelopedCells\": " << s.undevelopedCells << ",\n";
+    ofs << "  \"numHospitals\": " << s.numHospitals << ",\n";
+    ofs << "  \"numSchools\": " << s.numSchools << ",\n";
+    ofs << "  \"maxDistanceToSchool\": " << s.maxDistanceToSchool << ",\n";
+    ofs << "  \"maxDistanceToHospital\": " << s.maxDistanceToHospital << ",\n";
+    ofs << "  \"maxResidentialHeight\": " << s.maxResidentialHeight << ",\n";
+    ofs << "  \"maxCommercialHeight\": " << s.maxCommercialHeight << ",\n";
+    ofs << "  \"maxIndustrialHeight\": " << s.maxIndustrialHeight << "\n";
     ofs << "}";
     ofs.close();
 }
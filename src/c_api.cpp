@@ -0,0 +1,101 @@
+// C ABI for the city generator, consumed from Python via ctypes (see
+// python/generate_city.py).  Calling into the shared library avoids the
+// fork/exec and JSON round-trip of shelling out to the `citygen` binary:
+// the pipeline runs in-process and the summary is returned in a plain C
+// struct.  Model and summary files are still written to the output
+// directory so library callers get the same artefacts as CLI users.
+
+#include "CityGenerator.h"
+#include "Config.h"
+
+#include <cstdint>
+#include <exception>
+#include <filesystem>
+#include <string>
+
+extern "C" {
+
+/// Mirror of the fields Python passes in; layout must match the ctypes
+/// Structure in generate_city.py.
+struct CitygenCConfig {
+    std::uint32_t seed;
+    std::int32_t population;
+    std::int32_t grid_size;
+    double radius_fraction;
+    std::int32_t hospitals;
+    std::int32_t schools;
+    std::int32_t transport; // 0=car, 1=transit, 2=walk
+    const char *output_dir; // directory for city.obj / city_summary.json
+};
+
+/// Mirror of CitySummaryData with fixed-width fields for a stable ABI.
+struct CitygenCSummary {
+    std::int32_t grid_size;
+    std::uint64_t total_buildings;
+    std::uint64_t residential_cells;
+    std::uint64_t commercial_cells;
+    std::uint64_t industrial_cells;
+    std::uint64_t green_cells;
+    std::uint64_t undeveloped_cells;
+    std::uint64_t num_hospitals;
+    std::uint64_t num_schools;
+    double max_distance_to_school;
+    double max_distance_to_hospital;
+    std::int32_t max_residential_height;
+    std::int32_t max_commercial_height;
+    std::int32_t max_industrial_height;
+};
+
+/// Run the full generation pipeline and fill `out` with the summary.
+/// Returns 0 on success, non-zero on failure.  Never throws across the
+/// C boundary.
+int citygen_generate(const CitygenCConfig *c_cfg, CitygenCSummary *out) {
+    if (c_cfg == nullptr || out == nullptr || c_cfg->output_dir == nullptr) {
+        return 1;
+    }
+    try {
+        Config cfg;
+        cfg.seed = c_cfg->seed;
+        cfg.population = c_cfg->population;
+        cfg.grid_size = c_cfg->grid_size;
+        cfg.city_radius = c_cfg->radius_fraction;
+        cfg.hospitals = c_cfg->hospitals;
+        cfg.schools = c_cfg->schools;
+        switch (c_cfg->transport) {
+            case 1: cfg.transport_mode = Config::TransportMode::PublicTransit; break;
+            case 2: cfg.transport_mode = Config::TransportMode::Walk; break;
+            default: cfg.transport_mode = Config::TransportMode::Car; break;
+        }
+        cfg.normalize();
+
+        const std::string outDir(c_cfg->output_dir);
+        std::filesystem::create_directories(outDir);
+
+        City city = CityGenerator::generate(cfg);
+        city.saveOBJ(outDir + "/city.obj");
+        city.saveSummary(outDir + "/city_summary.json");
+
+        const CitySummaryData s = city.computeSummary();
+        out->grid_size = city.size;
+        out->total_buildings = s.totalBuildings;
+        out->residential_cells = s.residentialCells;
+        out->commercial_cells = s.commercialCells;
+        out->industrial_cells = s.industrialCells;
+        out->green_cells = s.greenCells;
+        out->undeveloped_cells = s.undevelopedCells;
+        out->num_hospitals = s.numHospitals;
+        out->num_schools = s.numSchools;
+        out->max_distance_to_school = s.maxDistanceToSchool;
+        out->max_distance_to_hospital = s.maxDistanceToHospital;
+        out->max_residential_height = s.maxResidentialHeight;
+        out->max_commercial_height = s.maxCommercialHeight;
+        out->max_industrial_height = s.maxIndustrialHeight;
+        return 0;
+    } catch (const std::exception &) {
+        return 2;
+    } catch (...) {
+        return 3;
+    }
+}
+
+} // extern "C"
@@ -0,0 +1,49 @@
+// Standalone fractal-noise kernel exported with C linkage so the Python
+// generator can call it through ctypes (see python/citygen_py.py).  The hash
+// chain matches the noise()/fractalNoise() pair in CityGenerator.cpp; it is
+// duplicated here rather than shared so the shared library has no other
+// dependencies and the generator's internals stay in the anonymous namespace.
+
+#include <cstdint>
+
+namespace {
+
+inline double hashNoise(std::uint32_t x, std::uint32_t y, std::uint32_t seed) {
+    std::uint32_t h = x * 374761393u;
+    h += y * 668265263u;
+    h ^= seed + 0x9e3779b9u + (h << 6) + (h >> 2);
+    h ^= (h >> 17);
+    h *= 0xed5ad4bbU;
+    h ^= (h >> 11);
+    h *= 0xac4c1b51U;
+    h ^= (h >> 15);
+    return (h & 0xFFFFFFu) / static_cast<double>(0x1000000u);
+}
+
+} // anonymous namespace
+
+extern "C" {
+
+// Fill `out` with fractal noise for `n` cells given by coordinate arrays.
+// Taking explicit coordinates lets the caller hash only the cells inside the
+// city disk; the loop carries no cross-cell dependencies, so the compiler is
+// free to auto-vectorize the hash chain.
+void citygen_noise_points(float *out, const std::int32_t *xs, const std::int32_t *ys,
+                          int n, std::uint32_t seed, int octaves) {
+    const double amplitudeSum = 2.0 - 1.0 / static_cast<double>(1u << (octaves - 1));
+    for (int j = 0; j < n; ++j) {
+        double total = 0.0;
+        double amplitude = 1.0;
+        std::uint32_t scale = 1u;
+        for (int i = 0; i < octaves; ++i) {
+            std::uint32_t sx = static_cast<std::uint32_t>(xs[j]) * scale;
+            std::uint32_t sy = static_cast<std::uint32_t>(ys[j]) * scale;
+            total += amplitude * hashNoise(sx, sy, seed + static_cast<std::uint32_t>(i) * 17u);
+            amplitude *= 0.5;
+            scale <<= 1;
+        }
+        out[j] = static_cast<float>(total / amplitudeSum);
+    }
+}
+
+} // extern "C"